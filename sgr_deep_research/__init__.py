@@ -4,13 +4,48 @@ SGR Deep Research - Schema-Guided Reasoning for Deep Research
 A powerful research assistant that combines structured reasoning with deep analysis capabilities.
 """
 
-from sgr_deep_research.api import *  # noqa: F403
-from sgr_deep_research.core import *  # noqa: F403
-from sgr_deep_research.services import *  # noqa: F403
+import importlib
 
 __version__ = "0.1.0"
 __author__ = "sgr-deep-research-team"
 
+# Публичные имена подпакетов загружаются лениво (PEP 562): `import sgr_deep_research`
+# и `python -m sgr_deep_research --help` не тянут FastAPI, OpenAI SDK и конфиг
+_LAZY_EXPORTS = {
+    # API
+    "app": "sgr_deep_research.api",
+    # Agents
+    "BaseAgent": "sgr_deep_research.core",
+    "SGRResearchAgent": "sgr_deep_research.core",
+    "SGRToolCallingResearchAgent": "sgr_deep_research.core",
+    "SGRAutoToolCallingResearchAgent": "sgr_deep_research.core",
+    "ToolCallingResearchAgent": "sgr_deep_research.core",
+    "SGRSOToolCallingResearchAgent": "sgr_deep_research.core",
+    # Models
+    "AgentStatesEnum": "sgr_deep_research.core",
+    "ResearchContext": "sgr_deep_research.core",
+    "SearchResult": "sgr_deep_research.core",
+    "SourceData": "sgr_deep_research.core",
+    # Other core modules
+    "PromptLoader": "sgr_deep_research.core",
+    "OpenAIStreamingGenerator": "sgr_deep_research.core",
+    # Services
+    "TavilySearchService": "sgr_deep_research.services",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # следующие обращения идут мимо __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
 
 __all__ = [
     "__version__",
@@ -3,10 +3,6 @@
 import argparse
 import os
 
-import uvicorn
-
-from sgr_deep_research.api.endpoints import app
-
 
 def main():
     """Запуск FastAPI сервера."""
@@ -18,9 +14,44 @@ def main():
     parser.add_argument(
         "--port", type=int, dest="port", default=int(os.environ.get("PORT", 8010)), help="Порт для прослушивания"
     )
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        dest="log_level",
+        default=os.environ.get("LOG_LEVEL", "info"),
+        choices=["critical", "error", "warning", "info", "debug", "trace"],
+        help="Уровень логирования uvicorn",
+    )
+    parser.add_argument(
+        "--access-log",
+        action="store_true",
+        dest="access_log",
+        default=os.environ.get("ACCESS_LOG", "0") == "1",
+        help="Логировать каждый HTTP запрос (по умолчанию выключено)",
+    )
+    parser.add_argument(
+        "--timeout-keep-alive",
+        type=int,
+        dest="timeout_keep_alive",
+        default=int(os.environ.get("TIMEOUT_KEEP_ALIVE", 75)),
+        help="Сколько секунд держать простаивающее keep-alive соединение",
+    )
     args = parser.parse_args()
 
-    uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+    # Тяжёлые импорты (uvicorn, FastAPI, агенты, конфиг) - только после разбора аргументов,
+    # чтобы --help и ошибки аргументов не ждали их загрузки
+    import uvicorn
+
+    from sgr_deep_research.api.endpoints import app
+
+    uvicorn.run(
+        app,
+        host=args.host,
+        port=args.port,
+        log_level=args.log_level,
+        access_log=args.access_log,
+        timeout_keep_alive=args.timeout_keep_alive,
+    )
 
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 import asyncio
 import logging
+import re
+import time
 
+import orjson
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from sgr_deep_research.api.models import (
     AGENT_MODEL_MAPPING,
@@ -22,6 +25,36 @@ app = FastAPI(title="SGR Deep Research API", version="1.0.0")
 
 # ToDo: better to move to a separate service
 agents_storage: dict[str, BaseAgent] = {}
+# Сколько агентов держим в памяти; сверх лимита вытесняются самые старые завершённые и брошенные
+MAX_STORED_AGENTS = 1000
+# Агент, ждущий уточнения дольше этого (секунды), считается брошенным клиентом
+CLARIFICATION_TIMEOUT = 3600
+
+
+def _store_agent(agent: BaseAgent):
+    """Store agent, evicting the oldest finished agents once storage exceeds
+    MAX_STORED_AGENTS.
+
+    Agents left waiting for clarification longer than
+    CLARIFICATION_TIMEOUT are cancelled and evicted as well. Running
+    agents are never evicted.
+    """
+    agents_storage[agent.id] = agent
+    excess = len(agents_storage) - MAX_STORED_AGENTS
+    if excess <= 0:
+        return
+    deadline = time.monotonic() - CLARIFICATION_TIMEOUT
+    finished, abandoned = [], []
+    for agent_id, stored in agents_storage.items():
+        if stored._context.state in AgentStatesEnum.FINISH_STATES.value:
+            finished.append(agent_id)
+        elif stored._context.state == AgentStatesEnum.WAITING_FOR_CLARIFICATION and stored.last_activity < deadline:
+            abandoned.append(agent_id)
+    for agent_id in abandoned:
+        logger.info("Agent %s waited for clarification too long, cancelling", agent_id)
+        agents_storage.pop(agent_id).cancel()
+    for agent_id in finished[: max(0, excess - len(abandoned))]:
+        del agents_storage[agent_id]
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -36,40 +69,69 @@ async def get_agent_state(agent_id: str):
 
     agent = agents_storage[agent_id]
 
-    current_state_dict = None
-    if agent._context.current_state_reasoning:
-        current_state_dict = agent._context.current_state_reasoning.model_dump()
-
     return AgentStateResponse(
         agent_id=agent.id,
         task=agent.task,
-        state=agent.state.value,
+        state=agent._context.state.value,
         searches_used=agent._context.searches_used,
         clarifications_used=agent._context.clarifications_used,
         sources_count=len(agent._context.sources),
-        current_state=current_state_dict,
+        # Модель reasoning отдаём как есть - сериализуется один раз вместе с ответом
+        current_state=agent._context.current_state_reasoning,
     )
 
 
 @app.get("/agents", response_model=AgentListResponse)
 async def get_agents_list():
     agents_list = [
-        AgentListItem(agent_id=agent.id, task=agent.task, state=agent.state.value) for agent in agents_storage.values()
+        AgentListItem(agent_id=agent.id, task=agent.task, state=agent._context.state.value)
+        for agent in agents_storage.values()
     ]
 
     return AgentListResponse(agents=agents_list, total=len(agents_list))
 
 
-@app.get("/v1/models")
-async def get_available_models():
-    """Get list of available agent models."""
-    return {
+# Список моделей неизменен - сериализуем один раз при импорте
+_MODELS_JSON = orjson.dumps(
+    {
         "data": [
             {"id": model.value, "object": "model", "created": 1234567890, "owned_by": "sgr-deep-research"}
             for model in AgentModel
         ],
         "object": "list",
     }
+)
+
+
+@app.get("/v1/models")
+async def get_available_models():
+    """Get list of available agent models."""
+    return Response(content=_MODELS_JSON, media_type="application/json")
+
+
+async def _agent_stream(agent: BaseAgent):
+    """Relay agent stream to the client and cancel the agent if the client
+    goes away before the stream is finished.
+
+    Agents waiting for clarification are kept: the client reconnects
+    with the answers. Streams superseded by a clarification stream and
+    agents that have already finished are never cancelled.
+    """
+    generation = agent.stream_generation
+    finished = False
+    try:
+        async for chunk in agent.streaming_generator.stream():
+            yield chunk
+        finished = True
+    finally:
+        if (
+            not finished
+            and generation == agent.stream_generation
+            and agent._context.state != AgentStatesEnum.WAITING_FOR_CLARIFICATION
+            and agent._context.state not in AgentStatesEnum.FINISH_STATES.value
+        ):
+            logger.info("Client disconnected, cancelling agent %s", agent.id)
+            agent.cancel()
 
 
 def extract_user_content_from_messages(messages):
@@ -79,7 +141,7 @@ def extract_user_content_from_messages(messages):
     raise ValueError("User message not found in messages")
 
 
-@app.post("agents/{agent_id}/provide_clarification")
+@app.post("/agents/{agent_id}/provide_clarification")
 async def provide_clarification(agent_id: str, request: ChatCompletionRequest):
     if not request.stream:
         raise HTTPException(status_code=501, detail="Only streaming responses are supported. Set 'stream=true'")
@@ -89,31 +151,43 @@ async def provide_clarification(agent_id: str, request: ChatCompletionRequest):
         agent = agents_storage.get(agent_id)
         if not agent:
             raise HTTPException(status_code=404, detail="Agent not found")
+        if agent._context.state != AgentStatesEnum.WAITING_FOR_CLARIFICATION:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Agent is not waiting for clarification (state: {agent._context.state.value})",
+            )
 
-        logger.info(f"Providing clarification to agent {agent.id}: {clarifications_content[:100]}...")
+        logger.info("Providing clarification to agent %s: %.100s...", agent.id, clarifications_content)
 
         await agent.provide_clarification(clarifications_content)
         return StreamingResponse(
-            agent.streaming_generator.stream(),
-            media_type="text/plain",
+            _agent_stream(agent),
+            media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
                 "X-Agent-ID": str(agent.id),
             },
         )
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error completion: {e}")
+        logger.error("Error completion: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ID агента имеет вид "<тип>_agent_<uuid4>"
+_AGENT_ID_RE = re.compile(r".+_[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+
 def _is_agent_id(model_str: str) -> bool:
-    """Check if model string is an agent ID (contains underscore and UUID-like
-    format)."""
-    return "_" in model_str and len(model_str) > 20
+    """Check if model string is an agent ID (type prefix followed by a
+    UUID)."""
+    return _AGENT_ID_RE.match(model_str) is not None
 
 
 @app.post("/v1/chat/completions")
@@ -135,42 +209,39 @@ async def create_chat_completion(request: ChatCompletionRequest):
         task = extract_user_content_from_messages(request.messages)
 
         # Determine agent model type
-        agent_model = request.model
-        if isinstance(agent_model, str) and _is_agent_id(agent_model):
+        model_name = request.model
+        if model_name is None or _is_agent_id(model_name):
             # If it's an agent ID but not found in storage, use default
-            agent_model = AgentModel.SGR_AGENT
-        elif agent_model is None:
-            agent_model = AgentModel.SGR_AGENT
-        elif isinstance(agent_model, str):
-            # Try to convert string to AgentModel enum
-            try:
-                agent_model = AgentModel(agent_model)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid model '{agent_model}'. Available models: {[m.value for m in AgentModel]}",
-                )
-
-        # Create agent using mapping
-        agent_class = AGENT_MODEL_MAPPING[agent_model]
+            model_name = AgentModel.SGR_AGENT.value
+
+        # Create agent using mapping: AgentModel is a str enum, so plain model names hit its keys directly
+        agent_class = AGENT_MODEL_MAPPING.get(model_name)
+        if agent_class is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid model '{model_name}'. Available models: {[m.value for m in AgentModel]}",
+            )
         agent = agent_class(task=task)
-        agents_storage[agent.id] = agent
-        logger.info(f"Agent {agent.id} ({agent_model.value}) created and stored for task: {task[:100]}...")
+        _store_agent(agent)
+        logger.info("Agent %s (%s) created and stored for task: %.100s...", agent.id, model_name, task)
 
         _ = asyncio.create_task(agent.execute())
         return StreamingResponse(
-            agent.streaming_generator.stream(),
-            media_type="text/plain",
+            _agent_stream(agent),
+            media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
                 "X-Agent-ID": str(agent.id),
-                "X-Agent-Model": agent_model.value,
+                "X-Agent-Model": model_name,
             },
         )
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error completion: {e}")
+        logger.error("Error completion: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,9 +1,9 @@
 """OpenAI-compatible models for API endpoints."""
 
 from enum import Enum
-from typing import Any, Dict, List, Literal
+from typing import Dict, List, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializeAsAny
 
 from sgr_deep_research.core.agents import (
     SGRAutoToolCallingResearchAgent,
@@ -12,6 +12,7 @@ from sgr_deep_research.core.agents import (
     SGRToolCallingResearchAgent,
     ToolCallingResearchAgent,
 )
+from sgr_deep_research.core.tools import ReasoningTool
 
 
 class AgentModel(str, Enum):
@@ -45,7 +46,7 @@ class ChatCompletionRequest(BaseModel):
     """Request for creating chat completion."""
 
     model: str | None = Field(
-        default=AgentModel.SGR_AGENT,
+        default=AgentModel.SGR_AGENT.value,
         description="Agent type or existing agent identifier",
         example="sgr-agent",
     )
@@ -86,7 +87,9 @@ class AgentStateResponse(BaseModel):
     searches_used: int = Field(description="Number of searches performed")
     clarifications_used: int = Field(description="Number of clarifications requested")
     sources_count: int = Field(description="Number of sources found")
-    current_state: Dict[str, Any] | None = Field(default=None, description="Current agent step")
+    # SerializeAsAny: отдаём все поля конкретной модели reasoning (NextStepTools с выбранным tool),
+    # а не только поля ReasoningTool
+    current_state: SerializeAsAny[ReasoningTool] | None = Field(default=None, description="Current agent step")
 
 
 class AgentListItem(BaseModel):
@@ -1,13 +1,18 @@
-import json
+import asyncio
 import logging
 import os
+import time
 import traceback
 import uuid
+import weakref
 from datetime import datetime
+from functools import cache
+from pathlib import Path
 from typing import Type
 
 import httpx
-from openai import AsyncOpenAI
+import orjson
+from openai import AsyncOpenAI, pydantic_function_tool
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
@@ -36,6 +41,9 @@ logger = logging.getLogger(__name__)
 class BaseAgent:
     """Base class for agents."""
 
+    # event loop -> {(base_url, api_key, proxy): AsyncOpenAI}, see _get_openai_client
+    _openai_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         task: str,
@@ -53,37 +61,80 @@ class BaseAgent:
         self.max_iterations = max_iterations
         self.max_clarifications = max_clarifications
 
-        client_kwargs = {"base_url": config.openai.base_url, "api_key": config.openai.api_key}
-        if config.openai.proxy.strip():
-            client_kwargs["http_client"] = httpx.AsyncClient(proxy=config.openai.proxy)
-
-        self.openai_client = AsyncOpenAI(**client_kwargs)
+        self.openai_client = self._get_openai_client(
+            config.openai.base_url, config.openai.api_key, config.openai.proxy.strip()
+        )
         self.streaming_generator = OpenAIStreamingGenerator(model=self.id)
+        self._execution_task: asyncio.Task | None = None
+        # Номер текущего SSE-потока: каждое уточнение открывает новый, старые перестают управлять агентом
+        self.stream_generation = 0
+        # time.monotonic() последнего перехода состояния со стороны клиента: создание, ожидание, уточнение
+        self.last_activity = time.monotonic()
+        # (searches_used, sources count) -> system prompt, see _prepare_context
+        self._system_prompt_cache: tuple[tuple[int, int], str] | None = None
+
+    @classmethod
+    def _get_openai_client(cls, base_url: str, api_key: str, proxy: str) -> AsyncOpenAI:
+        """One client (and connection pool) per settings and event loop,
+        shared by all agents.
+
+        The pool is bound to the loop it was opened on, so clients are
+        kept per loop and dropped together with it.
+        """
+        try:
+            clients = cls._openai_clients.setdefault(asyncio.get_running_loop(), {})
+        except RuntimeError:  # вне event loop: клиент не кэшируем
+            clients = {}
+        key = (base_url, api_key, proxy)
+        if key not in clients:
+            client_kwargs = {"base_url": base_url, "api_key": api_key}
+            if proxy:
+                client_kwargs["http_client"] = httpx.AsyncClient(proxy=proxy)
+            clients[key] = AsyncOpenAI(**client_kwargs)
+        return clients[key]
 
     async def provide_clarification(self, clarifications: str):
         """Receive clarification from external source (e.g. user input)"""
         self.conversation.append({"role": "user", "content": f"CLARIFICATIONS: {clarifications}"})
         self._context.clarifications_used += 1
+        self.stream_generation += 1
+        self.last_activity = time.monotonic()
         self._context.clarification_received.set()
         self._context.state = AgentStatesEnum.RESEARCHING
         logger.info(f"✅ Clarification received: {clarifications[:2000]}...")
 
+    def cancel(self):
+        """Stop running execution, e.g. when the client has disconnected and
+        nobody consumes the stream anymore."""
+        if self._execution_task is not None and not self._execution_task.done():
+            self._execution_task.cancel()
+
     def _log_reasoning(self, result: ReasoningTool) -> None:
         next_step = result.remaining_steps[0] if result.remaining_steps else "Completing"
+        # %-форматирование: строка собирается, только если INFO действительно пишется
         logger.info(
-            f"""
+            """
 ###############################################
 🤖 LLM RESPONSE DEBUG:
-   🧠 Reasoning Steps: {result.reasoning_steps}
-   📊 Current Situation: '{result.current_situation[:400]}...'
-   📋 Plan Status: '{result.plan_status[:400]}...'
-   🔍 Searches Done: {self._context.searches_used}
-   🔍 Clarifications Done: {self._context.clarifications_used}
-   ✅ Enough Data: {result.enough_data}
-   📝 Remaining Steps: {result.remaining_steps}
-   🏁 Task Completed: {result.task_completed}
-   ➡️ Next Step: {next_step}
-###############################################"""
+   🧠 Reasoning Steps: %s
+   📊 Current Situation: '%.400s...'
+   📋 Plan Status: '%.400s...'
+   🔍 Searches Done: %s
+   🔍 Clarifications Done: %s
+   ✅ Enough Data: %s
+   📝 Remaining Steps: %s
+   🏁 Task Completed: %s
+   ➡️ Next Step: %s
+###############################################""",
+            result.reasoning_steps,
+            result.current_situation,
+            result.plan_status,
+            self._context.searches_used,
+            self._context.clarifications_used,
+            result.enough_data,
+            result.remaining_steps,
+            result.task_completed,
+            next_step,
         )
         self.log.append(
             {
@@ -95,13 +146,16 @@ class BaseAgent:
         )
 
     def _log_tool_execution(self, tool: BaseTool, result: str):
+        # Полный дамп инструмента уже есть в self.log; в сообщение передаём сам объект - repr строится лениво
         logger.info(
-            f"""
+            """
 ###############################################
 🛠️ TOOL EXECUTION DEBUG:
-   🔧 Tool Name: {tool.tool_name}
-   📋 Tool Model: {tool.model_dump_json(indent=2)}
-###############################################"""
+   🔧 Tool Name: %s
+   📋 Tool Model: %r
+###############################################""",
+            tool.tool_name,
+            tool,
         )
         self.log.append(
             {
@@ -125,16 +179,66 @@ class BaseAgent:
             "log": self.log,
         }
 
-        json.dump(agent_log, open(filepath, "w", encoding="utf-8"), indent=2, ensure_ascii=False)
+        Path(filepath).write_bytes(orjson.dumps(agent_log, option=orjson.OPT_INDENT_2))
 
     async def _prepare_context(self) -> list[dict]:
         """Prepare conversation context with system prompt."""
-        system_prompt = PromptLoader.get_system_prompt(
-            user_request=self.task,
-            sources=list(self._context.sources.values()),
-            available_tools=self.toolkit,
-        )
-        return [{"role": "system", "content": system_prompt}, *self.conversation]
+        # Промпт меняется только вместе с источниками, а их добавляет лишь поиск: пока ключ тот же,
+        # отдаём тот же текст - без повторного рендера и с неизменным префиксом для prompt caching
+        cache_key = (self._context.searches_used, len(self._context.sources))
+        if self._system_prompt_cache is None or self._system_prompt_cache[0] != cache_key:
+            system_prompt = PromptLoader.get_system_prompt(
+                user_request=self.task,
+                sources=list(self._context.sources.values()),
+                available_tools=self.toolkit,
+            )
+            self._system_prompt_cache = (cache_key, system_prompt)
+        system_prompt = self._system_prompt_cache[1]
+        return [{"role": "system", "content": system_prompt}, *self._elide_stale_reasoning(self.conversation)]
+
+    @staticmethod
+    def _elide_stale_reasoning(conversation: list[dict]) -> list[dict]:
+        """Replace all but the latest reasoning tool call with its empty-
+        arguments form and a short placeholder result.
+
+        Each reasoning restates the whole plan and is superseded by the
+        next one, so re-sending older ones, whether as call arguments or
+        as the result, only grows the prompt every step. Full reasoning
+        stays in self.log.
+        """
+        reasoning_ids = [
+            message["tool_call_id"]
+            for message in conversation
+            if message["role"] == "tool" and message["tool_call_id"].endswith("-reasoning")
+        ]
+        if len(reasoning_ids) < 2:
+            return conversation
+        stale_ids = set(reasoning_ids[:-1])
+        elided = []
+        for message in conversation:
+            if message["role"] == "tool" and message["tool_call_id"] in stale_ids:
+                message = {**message, "content": "[superseded by later reasoning]"}
+            elif message["role"] == "assistant" and any(
+                call["id"] in stale_ids for call in message.get("tool_calls") or ()
+            ):
+                message = {
+                    **message,
+                    "tool_calls": [
+                        {**call, "function": {**call["function"], "arguments": "{}"}}
+                        if call["id"] in stale_ids
+                        else call
+                        for call in message["tool_calls"]
+                    ],
+                }
+            elided.append(message)
+        return elided
+
+    @classmethod
+    @cache
+    def _tool_schema(cls, tool: Type[BaseTool]) -> ChatCompletionFunctionToolParam:
+        """Build OpenAI function tool schema, cached per tool class as it never
+        changes at runtime."""
+        return pydantic_function_tool(tool, name=tool.tool_name, description=tool.description)
 
     async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
         """Prepare available tools for current agent state and progress."""
@@ -170,6 +274,7 @@ class BaseAgent:
                 }
             ]
         )
+        self._execution_task = asyncio.current_task()
         try:
             while self._context.state not in AgentStatesEnum.FINISH_STATES.value:
                 self._context.iteration += 1
@@ -178,16 +283,24 @@ class BaseAgent:
                 reasoning = await self._reasoning_phase()
                 self._context.current_state_reasoning = reasoning
                 action_tool = await self._select_action_phase(reasoning)
+                if isinstance(action_tool, ClarificationTool):
+                    # Вопросы уже отправлены в stream - переходим в ожидание до следующего await,
+                    # чтобы отключение клиента после их получения не считалось обрывом исследования
+                    self._context.state = AgentStatesEnum.WAITING_FOR_CLARIFICATION
+                    self._context.clarification_received.clear()
+                    self.last_activity = time.monotonic()
                 action_result = await self._action_phase(action_tool)
 
                 if isinstance(action_tool, ClarificationTool):
                     logger.info("\n⏸️  Research paused - please answer questions")
                     logger.info(action_result)
-                    self._context.state = AgentStatesEnum.WAITING_FOR_CLARIFICATION
-                    self._context.clarification_received.clear()
                     await self._context.clarification_received.wait()
                     continue
 
+        except asyncio.CancelledError:
+            logger.warning(f"⛔ Agent {self.id} execution cancelled")
+            self._context.state = AgentStatesEnum.FAILED
+            raise
         except Exception as e:
             logger.error(f"❌ Agent execution error: {str(e)}")
             self._context.state = AgentStatesEnum.FAILED
@@ -195,4 +308,5 @@ class BaseAgent:
         finally:
             if self.streaming_generator is not None:
                 self.streaming_generator.finish()
-            self._save_agent_log()
+            # Запись лога - блокирующий I/O, не держим им event loop
+            await asyncio.to_thread(self._save_agent_log)
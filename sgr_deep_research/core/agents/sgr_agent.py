@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import uuid
 from typing import Type
@@ -83,9 +84,8 @@ class SGRResearchAgent(BaseAgent):
             temperature=config.openai.temperature,
         ) as stream:
             async for event in stream:
-                if event.type == "chunk":
-                    content = event.chunk.choices[0].delta.content
-                    self.streaming_generator.add_chunk(content)
+                if event.type == "content.delta":
+                    self.streaming_generator.add_chunk(event.delta)
         reasoning: NextStepToolStub = (await stream.get_final_completion()).choices[0].message.parsed  # type: ignore
         # we are not fully sure if it should be in conversation or not. Looks like not necessary data
         # self.conversation.append({"role": "assistant", "content": reasoning.model_dump_json(exclude={"function"})})
@@ -96,6 +96,7 @@ class SGRResearchAgent(BaseAgent):
         tool = reasoning.function
         if not isinstance(tool, BaseTool):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        tool_arguments = tool.model_dump_json()
         self.conversation.append(
             {
                 "role": "assistant",
@@ -106,19 +107,18 @@ class SGRResearchAgent(BaseAgent):
                         "id": f"{self._context.iteration}-action",
                         "function": {
                             "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
+                            "arguments": tool_arguments,
                         },
                     }
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
+        self.streaming_generator.add_tool_call(f"{self._context.iteration}-action", tool.tool_name, tool_arguments)
         return tool
 
     async def _action_phase(self, tool: BaseTool) -> str:
-        result = tool(self._context)
+        # Tools are synchronous (e.g. blocking Tavily HTTP calls), keep them off the event loop
+        result = await asyncio.to_thread(tool, self._context)
         self.conversation.append(
             {"role": "tool", "content": result, "tool_call_id": f"{self._context.iteration}-action"}
         )
@@ -39,21 +39,6 @@ class SGRSOToolCallingResearchAgent(SGRToolCallingResearchAgent):
         self.id = f"sgr_so_tool_calling_agent_{uuid.uuid4()}"
 
     async def _reasoning_phase(self) -> ReasoningTool:
-        async with self.openai_client.chat.completions.stream(
-            model=config.openai.model,
-            messages=await self._prepare_context(),
-            max_tokens=config.openai.max_tokens,
-            temperature=config.openai.temperature,
-            tools=await self._prepare_tools(),
-            tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
-        ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    content = event.chunk.choices[0].delta.content
-                    self.streaming_generator.add_chunk(content)
-            reasoning: ReasoningTool = (  # noqa
-                (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments  #
-            )
         async with self.openai_client.chat.completions.stream(
             model=config.openai.model,
             response_format=ReasoningTool,
@@ -62,9 +47,8 @@ class SGRSOToolCallingResearchAgent(SGRToolCallingResearchAgent):
             temperature=config.openai.temperature,
         ) as stream:
             async for event in stream:
-                if event.type == "chunk":
-                    content = event.chunk.choices[0].delta.content
-                    self.streaming_generator.add_chunk(content)
+                if event.type == "content.delta":
+                    self.streaming_generator.add_chunk(event.delta)
         reasoning: ReasoningTool = (await stream.get_final_completion()).choices[0].message.parsed
         tool_call_result = reasoning(self._context)
         self.conversation.append(
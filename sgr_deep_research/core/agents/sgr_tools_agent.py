@@ -2,7 +2,6 @@ import logging
 import uuid
 from typing import Literal, Type
 
-from openai import pydantic_function_tool
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agents.sgr_agent import SGRResearchAgent
@@ -69,7 +68,7 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
             tools -= {
                 WebSearchTool,
             }
-        return [pydantic_function_tool(tool, name=tool.tool_name, description=tool.description) for tool in tools]
+        return [self._tool_schema(tool) for tool in tools]
 
     async def _reasoning_phase(self) -> ReasoningTool:
         async with self.openai_client.chat.completions.stream(
@@ -82,9 +81,8 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
         ) as stream:
             async for event in stream:
                 # print(event)
-                if event.type == "chunk":
-                    content = event.chunk.choices[0].delta.content
-                    self.streaming_generator.add_chunk(content)
+                if event.type == "content.delta":
+                    self.streaming_generator.add_chunk(event.delta)
             reasoning: ReasoningTool = (  # noqa
                 (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments  #
             )
@@ -121,13 +119,13 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
             tool_choice=self.tool_choice,
         ) as stream:
             async for event in stream:
-                if event.type == "chunk":
-                    content = event.chunk.choices[0].delta.content
-                    self.streaming_generator.add_chunk(content)
+                if event.type == "content.delta":
+                    self.streaming_generator.add_chunk(event.delta)
         tool = (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
 
         if not isinstance(tool, BaseTool):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        tool_arguments = tool.model_dump_json()
         self.conversation.append(
             {
                 "role": "assistant",
@@ -138,13 +136,11 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
                         "id": f"{self._context.iteration}-action",
                         "function": {
                             "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
+                            "arguments": tool_arguments,
                         },
                     }
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
+        self.streaming_generator.add_tool_call(f"{self._context.iteration}-action", tool.tool_name, tool_arguments)
         return tool
@@ -55,6 +55,9 @@ class ResearchContext(BaseModel):
     sources: dict[str, SourceData] = Field(default_factory=dict, description="Dictionary of found sources")
 
     searches_used: int = Field(default=0, description="Number of searches performed")
+    search_cache: dict[tuple[str, int, bool], dict] = Field(
+        default_factory=dict, exclude=True, description="Raw search responses of this research by query"
+    )
 
     clarifications_used: int = Field(default=0, description="Number of clarifications requested")
     clarification_received: asyncio.Event = Field(
@@ -26,17 +26,22 @@ class PromptLoader:
 
         raise FileNotFoundError(f"Prompt file not found: {user_file_path} or {lib_file_path}")
 
+    @classmethod
+    @cache
+    def _format_available_tools(cls, available_tools: tuple[BaseTool, ...]) -> str:
+        return "\n".join(
+            f"{i}. {tool.tool_name}: {tool.description}" for i, tool in enumerate(available_tools, start=1)
+        )
+
     @classmethod
     def get_system_prompt(cls, user_request: str, sources: list[SourceData], available_tools: list[BaseTool]) -> str:
         sources_formatted = "\n".join([str(source) for source in sources])
         template = cls._load_prompt_file(config.prompts.system_prompt_file)
-        available_tools_str_list = [
-            f"{i}. {tool.tool_name}: {tool.description}" for i, tool in enumerate(available_tools, start=1)
-        ]
         try:
             return template.format(
-                current_date=datetime.now().strftime("%Y-%m-%d-%H:%M:%S"),
-                available_tools="\n".join(available_tools_str_list),
+                # Точность до дня: секунды меняли бы промпт на каждом шаге и сбивали кэш префикса
+                current_date=datetime.now().strftime("%Y-%m-%d"),
+                available_tools=cls._format_available_tools(tuple(available_tools)),
                 user_request=user_request,
                 sources_formatted=sources_formatted,
             )
@@ -1,9 +1,17 @@
 import asyncio
-import json
 import time
 
+import orjson
+
 
 class StreamingGenerator:
+    __slots__ = ("queue",)
+
+    # Долгие шаги (reasoning, поиск) могут молчать дольше idle-таймаута прокси/балансировщика:
+    # раз в keepalive_interval секунд без данных отправляем SSE-комментарий, клиенты его игнорируют
+    keepalive_interval = 15.0
+    keepalive_message = ": keepalive\n\n"
+
     def __init__(self):
         self.queue = asyncio.Queue()
 
@@ -15,39 +23,63 @@ class StreamingGenerator:
 
     async def stream(self):
         while True:
-            data = await self.queue.get()
-            if data is None:  # Завершающий символ
+            try:
+                batch = [await asyncio.wait_for(self.queue.get(), self.keepalive_interval)]
+            except asyncio.TimeoutError:
+                yield self.keepalive_message
+                continue
+            # Забираем всё, что уже накопилось, чтобы отдать одной записью
+            while batch[-1] is not None and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            finished = batch[-1] is None  # Завершающий символ
+            if finished:
+                batch.pop()
+            if batch:
+                yield "".join(batch)
+            if finished:
                 break
-            yield data
 
 
 class OpenAIStreamingGenerator(StreamingGenerator):
+    __slots__ = ("model", "fingerprint", "id", "created", "choice_index", "_chunk_prefix", "_chunk_suffix")
+
     def __init__(self, model="gpt-4o"):
         super().__init__()
         self.model = model
         self.fingerprint = f"fp_{hex(hash(model))[-8:]}"
-        self.id = f"chatcmpl-{int(time.time())}{hash(str(time.time()))}"[:29]
-        self.created = int(time.time())
+        now = time.time()
+        self.id = f"chatcmpl-{int(now)}{hash(str(now))}"[:29]
+        self.created = int(now)
         self.choice_index = 0
+        # Всё, кроме content, в content-чанках неизменно: сериализуем один раз
+        # и на каждый токен кодируем только сам текст
+        placeholder = "\0"
+        template = orjson.dumps(
+            {
+                "id": self.id,
+                "object": "chat.completion.chunk",
+                "created": self.created,
+                "model": self.model,
+                "system_fingerprint": self.fingerprint,
+                "choices": [
+                    {
+                        "delta": {"content": placeholder, "role": "assistant", "tool_calls": None},
+                        "index": self.choice_index,
+                        "finish_reason": None,
+                        "logprobs": None,
+                    }
+                ],
+                "usage": None,
+            }
+        ).decode()
+        prefix, suffix = template.split(orjson.dumps(placeholder).decode())
+        self._chunk_prefix = f"data: {prefix}"
+        self._chunk_suffix = f"{suffix}\n\n"
 
-    def add_chunk(self, content: str):
-        response = {
-            "id": self.id,
-            "object": "chat.completion.chunk",
-            "created": self.created,
-            "model": self.model,
-            "system_fingerprint": self.fingerprint,
-            "choices": [
-                {
-                    "delta": {"content": content, "role": "assistant", "tool_calls": None},
-                    "index": self.choice_index,
-                    "finish_reason": None,
-                    "logprobs": None,
-                }
-            ],
-            "usage": None,
-        }
-        super().add(f"data: {json.dumps(response)}\n\n")
+    def add_chunk(self, content: str | None):
+        if not content:  # tool call / role-only deltas carry no text, nothing to send
+            return
+        super().add(f"{self._chunk_prefix}{orjson.dumps(content).decode()}{self._chunk_suffix}")
 
     def add_tool_call(self, tool_call_id: str, function_name: str, arguments: str):
         """Добавляет tool call chunk."""
@@ -56,7 +88,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             "object": "chat.completion.chunk",
             "created": self.created,
             "model": self.model,
-            "system_fingerprint": f"fp_{hex(hash(self.model))[-8:]}",
+            "system_fingerprint": self.fingerprint,
             "choices": [
                 {
                     "delta": {
@@ -76,7 +108,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             ],
             "usage": None,
         }
-        super().add(f"data: {json.dumps(response)}\n\n")
+        super().add(f"data: {orjson.dumps(response).decode()}\n\n")
 
     def finish(self, finish_reason: str = "stop"):
         """Завершает stream с финальным chunk и usage."""
@@ -85,10 +117,9 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             "object": "chat.completion.chunk",
             "created": self.created,
             "model": self.model,
-            "system_fingerprint": f"fp_{hex(hash(self.model))[-8:]}",
+            "system_fingerprint": self.fingerprint,
             "choices": [{"index": self.choice_index, "delta": {}, "logprobs": None, "finish_reason": finish_reason}],
             "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
         }
-        super().add(f"data: {json.dumps(final_response)}\n\n")
-        super().add("data: [DONE]\n\n")
+        super().add(f"data: {orjson.dumps(final_response).decode()}\n\ndata: [DONE]\n\n")
         super().finish()
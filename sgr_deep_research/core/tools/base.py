@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import operator
 from abc import ABC
-from functools import reduce
+from functools import cache, reduce
 from typing import TYPE_CHECKING, Annotated, ClassVar, Literal, Type, TypeVar
 
 from pydantic import BaseModel, Field, create_model
@@ -60,7 +60,6 @@ class GeneratePlanTool(BaseTool):
 
     def __call__(self, context: ResearchContext) -> str:
         return self.model_dump_json(
-            indent=2,
             exclude={
                 "reasoning",
             },
@@ -78,7 +77,6 @@ class AdaptPlanTool(BaseTool):
 
     def __call__(self, context: ResearchContext) -> str:
         return self.model_dump_json(
-            indent=2,
             exclude={
                 "reasoning",
             },
@@ -95,9 +93,7 @@ class AgentCompletionTool(BaseTool):
 
     def __call__(self, context: ResearchContext) -> str:
         context.state = self.status
-        return self.model_dump_json(
-            indent=2,
-        )
+        return self.model_dump_json()
 
 
 class ReasoningTool(BaseTool):
@@ -121,9 +117,7 @@ class ReasoningTool(BaseTool):
     task_completed: bool = Field(description="Is the research task finished?")
 
     def __call__(self, *args, **kwargs):
-        return self.model_dump_json(
-            indent=2,
-        )
+        return self.model_dump_json()
 
 
 T = TypeVar("T", bound=BaseTool)
@@ -141,6 +135,7 @@ class NextStepToolsBuilder:
     pydantic models level."""
 
     @classmethod
+    @cache
     def _create_discriminant_tool(cls, tool_class: Type[T]) -> Type[BaseModel]:
         """Create discriminant version of tool with tool_name as instance
         field."""
@@ -169,13 +164,23 @@ class NextStepToolsBuilder:
         return Annotated[union, Field()]
 
     @classmethod
-    def build_NextStepTools(cls, tools_list: list[Type[T]]) -> Type[NextStepToolStub]:  # noqa
+    @cache
+    def _build_NextStepTools(cls, tools_set: frozenset[Type[T]]) -> Type[NextStepToolStub]:  # noqa
         return create_model(
             "NextStepTools",
             __base__=NextStepToolStub,
-            function=(cls._create_tool_types_union(tools_list), Field()),
+            function=(cls._create_tool_types_union(list(tools_set)), Field()),
         )
 
+    @classmethod
+    def build_NextStepTools(cls, tools_list: list[Type[T]]) -> Type[NextStepToolStub]:  # noqa
+        """Build NextStepTools model for given tools.
+
+        Models are cached per tool set: agents rebuild the schema every
+        step, but only a handful of distinct tool sets occur.
+        """
+        return cls._build_NextStepTools(frozenset(tools_list))
+
 
 system_agent_tools = [
     ClarificationTool,
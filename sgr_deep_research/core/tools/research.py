@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
+import re
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+import orjson
 from pydantic import Field
 
 from sgr_deep_research.core.models import SearchResult
@@ -20,6 +22,9 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 config = get_config()
 
+# Anything but letters, digits, "_", "-" and space is dropped from report file names
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\- ]")
+
 
 class CreateReportTool(BaseTool):
     """Create comprehensive detailed report with citations as a final step of
@@ -40,19 +45,24 @@ class CreateReportTool(BaseTool):
         # Save report
         reports_dir = config.execution.reports_dir
         os.makedirs(reports_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_title = "".join(c for c in self.title if c.isalnum() or c in (" ", "-", "_"))[:50]
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        safe_title = _UNSAFE_FILENAME_CHARS.sub("", self.title)[:50]
         filename = f"{timestamp}_{safe_title}.md"
         filepath = os.path.join(reports_dir, filename)
 
         # Format full report with sources
-        full_content = f"# {self.title}\n\n"
-        full_content += f"*Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
-        full_content += self.content + "\n\n"
-        full_content += "\n".join(["- " + str(source) for source in context.sources.values()])
+        full_content = "".join(
+            [
+                f"# {self.title}\n\n",
+                f"*Created: {now.strftime('%Y-%m-%d %H:%M:%S')}*\n\n",
+                self.content,
+                "\n\n",
+                "\n".join(["- " + str(source) for source in context.sources.values()]),
+            ]
+        )
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(full_content)
+        Path(filepath).write_text(full_content, encoding="utf-8")
 
         report = {
             "title": self.title,
@@ -61,7 +71,7 @@ class CreateReportTool(BaseTool):
             "sources_count": len(context.sources),
             "word_count": len(self.content.split()),
             "filepath": filepath,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
         logger.info(
             "📝 CREATE REPORT FULL DEBUG:\n"
@@ -73,7 +83,7 @@ class CreateReportTool(BaseTool):
             f"   📊 Words: {report['word_count']}, Sources: {report['sources_count']}\n"
             f"   💾 Saved: {filepath}\n"
         )
-        return json.dumps(report, indent=2, ensure_ascii=False)
+        return orjson.dumps(report).decode()
 
 
 class WebSearchTool(BaseTool):
@@ -103,15 +113,21 @@ class WebSearchTool(BaseTool):
 
         logger.info(f"🔍 Search query: '{self.query}'")
 
+        # Повторы запроса в рамках одного исследования отдаются из кэша контекста, без обращения к Tavily
         sources = self._search_service.search(
             query=self.query,
             max_results=self.max_results,
+            response_cache=context.search_cache,
         )
 
-        sources = TavilySearchService.rearrange_sources(sources, starting_number=len(context.sources) + 1)
-
-        for source in sources:
+        # context.sources только дополняется: уже известные URL сохраняют свой номер и позицию,
+        # иначе список источников в system prompt перестраивался бы и ломал кэш префикса у провайдера
+        new_sources = list({source.url: source for source in sources if source.url not in context.sources}.values())
+        TavilySearchService.rearrange_sources(new_sources, starting_number=len(context.sources) + 1)
+        for source in new_sources:
             context.sources[source.url] = source
+        for source in sources:
+            source.number = context.sources[source.url].number
 
         search_result = SearchResult(
             query=self.query,
@@ -121,22 +137,23 @@ class WebSearchTool(BaseTool):
         )
         context.searches.append(search_result)
 
-        formatted_result = f"Search Query: {search_result.query}\n\n"
+        result_parts = [f"Search Query: {search_result.query}\n\n"]
 
         if search_result.answer:
-            formatted_result += f"AI Answer: {search_result.answer}\n\n"
+            result_parts.append(f"AI Answer: {search_result.answer}\n\n")
 
-        formatted_result += "Search Results:\n\n"
+        result_parts.append("Search Results:\n\n")
 
         for source in sources:
             if source.full_content:
-                formatted_result += (
+                result_parts.append(
                     f"{str(source)}\n\n**Full Content (Markdown):**\n"
                     f"{source.full_content[: config.scraping.content_limit]}\n\n"
                 )
             else:
-                formatted_result += f"{str(source)}\n{source.snippet}\n\n"
+                result_parts.append(f"{str(source)}\n{source.snippet}\n\n")
 
+        formatted_result = "".join(result_parts)
         context.searches_used += 1
         logger.debug(formatted_result)
         return formatted_result
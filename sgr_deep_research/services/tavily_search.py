@@ -1,19 +1,33 @@
 import logging
-
-from tavily import TavilyClient
+from functools import cache
+from typing import TYPE_CHECKING
 
 from sgr_deep_research.core.models import SourceData
 from sgr_deep_research.settings import get_config
 
+if TYPE_CHECKING:
+    from tavily import TavilyClient
+
 logger = logging.getLogger(__name__)
 
 
 class TavilySearchService:
     def __init__(self):
         config = get_config()
-        self._client = TavilyClient(api_key=config.tavily.api_key, api_base_url=config.tavily.api_base_url)
+        self._client = self._get_client(config.tavily.api_key, config.tavily.api_base_url)
         self._config = config
 
+    @classmethod
+    @cache
+    def _get_client(cls, api_key: str, api_base_url: str) -> "TavilyClient":
+        """Shared TavilyClient per credentials, so its HTTP session keeps
+        connections alive between searches instead of a new TLS handshake each
+        time."""
+        # tavily тянет requests и свои модули - импортируем только когда клиент впервые нужен
+        from tavily import TavilyClient
+
+        return TavilyClient(api_key=api_key, api_base_url=api_base_url)
+
     @staticmethod
     def rearrange_sources(sources: list[SourceData], starting_number=1) -> list[SourceData]:
         for i, source in enumerate(sources, starting_number):
@@ -25,6 +39,7 @@ class TavilySearchService:
         query: str,
         max_results: int | None = None,
         include_raw_content: bool = True,
+        response_cache: dict[tuple[str, int, bool], dict] | None = None,
     ) -> (str, list[SourceData]):
         """Perform search through Tavily API and return results with
         SourceData.
@@ -33,6 +48,7 @@ class TavilySearchService:
             query: Search query
             max_results: Maximum number of results (default from config)
             include_raw_content: Include raw page content
+            response_cache: Raw responses of earlier searches in the same research, reused for repeated queries
 
         Returns:
             Tuple with tavily answer and list of SourceData
@@ -41,17 +57,32 @@ class TavilySearchService:
         logger.info(f"🔍 Tavily search: '{query}' (max_results={max_results})")
 
         # Execute search through Tavily
-        response = self._client.search(
-            query=query,
-            max_results=max_results,
-            include_raw_content=include_raw_content,
-        )
+        response = self._cached_search(query, max_results, include_raw_content, response_cache)
 
         # Convert results to SourceData
         sources = self._convert_to_source_data(response)
 
         return sources
 
+    def _cached_search(
+        self, query: str, max_results: int, include_raw_content: bool, response_cache: dict | None
+    ) -> dict:
+        """Return Tavily response for the query, reusing an identical search
+        from response_cache if there was one."""
+        key = (query.strip().lower(), max_results, include_raw_content)
+        if response_cache is not None and key in response_cache:
+            logger.info(f"♻️ Tavily cache hit: '{query}'")
+            return response_cache[key]
+
+        response = self._client.search(
+            query=query,
+            max_results=max_results,
+            include_raw_content=include_raw_content,
+        )
+        if response_cache is not None:
+            response_cache[key] = response
+        return response
+
     def _convert_to_source_data(self, response: dict) -> list[SourceData]:
         """Convert Tavily response to SourceData list."""
         sources = []